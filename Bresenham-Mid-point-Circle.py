@@ -1,12 +1,33 @@
 import csv
+import os
+import sys
+import random
+import hashlib
+import struct
+import asyncio
+import collections
+import queue
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+from array import array
 from tkinter import filedialog, messagebox
 import tkinter as tk
 from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import time
+import json
+import functools
+from contextlib import contextmanager, nullcontext
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # optional compiled backend
+    numba = None
+
 
 def dda_line(x1, y1, x2, y2):
     points = []
@@ -107,8 +128,31 @@ def midpoint_line(x1, y1, x2, y2):
     return points
 
 
-def bresenham_circle(xc, yc, r):
+# Octant of each of the 8 mirrored points, in points.extend order. Octants
+# are numbered counter-clockwise from the +x axis, 1 covering 0-45 degrees.
+# These tables are the definition of the labels shown in the circle table,
+# including where points on the axes (x == 0) and the diagonals (x == y)
+# belong.
+_OCTANTS = (2, 3, 8, 6, 1, 4, 7, 5)
+_OCTANTS_AXIS = (2, 2, 8, 8, 1, 4, 1, 4)
+_OCTANTS_DIAGONAL = (1, 3, 7, 5, 1, 3, 7, 5)
+_OCTANTS_CENTRE = (1,) * 8
+
+
+def _octant_labels(x, y):
+    if x == 0:
+        return _OCTANTS_CENTRE if y == 0 else _OCTANTS_AXIS
+    return _OCTANTS_DIAGONAL if x == y else _OCTANTS
+
+
+def bresenham_circle(xc, yc, r, return_octants=False):
+    """Bresenham circle; with return_octants also a uint8 octant label array.
+
+    Labels are taken from the mirror slot of each point while it is emitted,
+    so they cost no extra pass over the pixels.
+    """
     points = []
+    octants = array('B')
     x = 0
     y = r
     d = 3 - 2 * r
@@ -121,6 +165,8 @@ def bresenham_circle(xc, yc, r):
             (xc + y, yc + x), (xc - y, yc + x),
             (xc + y, yc - x), (xc - y, yc - x)
         ])
+        if return_octants:
+            octants.extend(_octant_labels(x, y))
 
         if d < 0:
             d = d + 4 * x + 6
@@ -129,11 +175,15 @@ def bresenham_circle(xc, yc, r):
             y -= 1
         x += 1
 
+    if return_octants:
+        return points, np.frombuffer(octants, dtype=np.uint8)
     return points
 
 
-def midpoint_circle(xc, yc, r):
+def midpoint_circle(xc, yc, r, return_octants=False):
+    """Midpoint circle; with return_octants also a uint8 octant label array"""
     points = []
+    octants = array('B')
     x = 0
     y = r
     p = 1 - r
@@ -146,6 +196,8 @@ def midpoint_circle(xc, yc, r):
             (xc + y, yc + x), (xc - y, yc + x),
             (xc + y, yc - x), (xc - y, yc - x)
         ])
+        if return_octants:
+            octants.extend(_octant_labels(x, y))
 
         if p < 0:
             p = p + 2 * x + 3
@@ -154,9 +206,513 @@ def midpoint_circle(xc, yc, r):
             y -= 1
         x += 1
 
+    if return_octants:
+        return points, np.frombuffer(octants, dtype=np.uint8)
+    return points
+
+
+def bresenham_polyline(vertices, closed=False):
+    """Rasterize a chain of Bresenham segments in one pass.
+
+    Each segment stops one pixel short of its end vertex, which is the next
+    segment's first pixel, so shared joints are emitted once. With closed
+    the chain returns to the first vertex without repeating it. The pixels
+    match concatenated bresenham_line calls with the joint duplicates
+    removed.
+    """
+    points = []
+    if not vertices:
+        return points
+
+    vertices = list(vertices)
+    if closed and len(vertices) > 1:
+        vertices.append(vertices[0])
+
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:]):
+        dx = abs(x2 - x1)
+        dy = abs(y2 - y1)
+
+        x, y = x1, y1
+
+        step_x = 1 if x2 > x1 else -1
+        step_y = 1 if y2 > y1 else -1
+
+        if dx > dy:
+            p = 2 * dy - dx
+            for _ in range(dx):
+                points.append((x, y))
+                if p >= 0:
+                    y += step_y
+                    p -= 2 * dx
+                x += step_x
+                p += 2 * dy
+        else:
+            p = 2 * dx - dy
+            for _ in range(dy):
+                points.append((x, y))
+                if p >= 0:
+                    x += step_x
+                    p -= 2 * dy
+                y += step_y
+                p += 2 * dx
+
+    # An open chain ends on its last vertex; a closed chain whose vertices
+    # all coincide drew nothing and still covers its one pixel
+    if not closed or not points:
+        points.append(tuple(vertices[-1]))
+
+    return points
+
+
+def scanline_polygon(vertices):
+    """Fill a polygon's interior with an active-edge table scanline pass.
+
+    Scanlines are sampled at integer y using the half-open [ymin, ymax)
+    rule per edge, and each span covers the pixels from ceil(x_left) to
+    floor(x_right) (even-odd rule), so the work is proportional to the
+    filled area plus the edge count.
+    """
+    points = []
+    n = len(vertices)
+    if n < 3:
+        return points
+
+    # Edge table bucketed by starting scanline; horizontal edges never
+    # cross a scanline and are dropped
+    edge_table = {}
+    for i in range(n):
+        (xa, ya), (xb, yb) = vertices[i], vertices[(i + 1) % n]
+        if ya == yb:
+            continue
+        if ya > yb:
+            xa, ya, xb, yb = xb, yb, xa, ya
+        edge_table.setdefault(ya, []).append((ya, yb, xa, (xb - xa) / (yb - ya)))
+    if not edge_table:
+        return points
+
+    y_min = min(edge_table)
+    y_max = max(y for _, y in vertices)
+    active = []
+    for y in range(y_min, y_max):
+        active = [edge for edge in active if edge[1] > y]
+        active.extend(edge_table.get(y, ()))
+
+        crossings = sorted(x0 + (y - y0) * inv_slope
+                           for y0, _, x0, inv_slope in active)
+        for x_left, x_right in zip(crossings[::2], crossings[1::2]):
+            points.extend((x, y) for x in range(int(np.ceil(x_left)),
+                                                int(np.floor(x_right)) + 1))
+
+    return points
+
+
+def bresenham_polygon(vertices, filled=False):
+    """Closed Bresenham outline, optionally filled with scanline_polygon.
+
+    Edges that double back near an acute vertex can revisit an outline
+    pixel, so the outline is deduplicated in drawing order, and filled
+    interior pixels that already lie on it are skipped; every pixel is
+    emitted once.
+    """
+    outline = set()
+    points = []
+    for point in bresenham_polyline(vertices, closed=True):
+        if point not in outline:
+            outline.add(point)
+            points.append(point)
+    if filled:
+        points.extend(point for point in scanline_polygon(vertices)
+                      if point not in outline)
+    return points
+
+
+def _ellipse_quadrant(rx, ry):
+    """Yield the first-quadrant offsets of a midpoint ellipse, (0, ry) to (rx, 0).
+
+    Decision variables are scaled by 4 so the whole walk stays in integers.
+    """
+    rx2, ry2 = rx * rx, ry * ry
+    x, y = 0, ry
+    dx, dy = 0, 2 * rx2 * y
+
+    # Region 1: slope shallower than -1, step in x
+    d1 = 4 * ry2 - 4 * rx2 * ry + rx2
+    while dx < dy:
+        yield x, y
+        x += 1
+        dx += 2 * ry2
+        if d1 < 0:
+            d1 += 4 * (dx + ry2)
+        else:
+            y -= 1
+            dy -= 2 * rx2
+            d1 += 4 * (dx - dy + ry2)
+
+    # Region 2: slope steeper than -1, step in y
+    d2 = ry2 * (2 * x + 1) ** 2 + 4 * rx2 * (y - 1) ** 2 - 4 * rx2 * ry2
+    while y >= 0:
+        yield x, y
+        y -= 1
+        dy -= 2 * rx2
+        if d2 > 0:
+            d2 += 4 * (rx2 - dy)
+        else:
+            x += 1
+            dx += 2 * ry2
+            d2 += 4 * (dx - dy + rx2)
+
+
+def midpoint_ellipse(xc, yc, rx, ry):
+    points = []
+    if rx == 0 or ry == 0:
+        # Degenerate ellipse: a straight segment along the other axis
+        return [(xc + x, yc + y)
+                for x in range(-rx, rx + 1) for y in range(-ry, ry + 1)]
+
+    for x, y in _ellipse_quadrant(rx, ry):
+        # Add points in all quadrants
+        points.extend([
+            (xc + x, yc + y), (xc - x, yc + y),
+            (xc + x, yc - y), (xc - x, yc - y)
+        ])
+
+    return points
+
+
+def _arc_quadrant_ranges(start_angle, end_angle):
+    """Split a counter-clockwise arc into per-quadrant direction ranges.
+
+    Returns four entries, one per quadrant (+x+y, -x+y, -x-y, +x-y): None
+    when the arc covers the whole quadrant, otherwise a list of unit
+    direction pairs bounding the covered sub-ranges (empty if uncovered).
+    """
+    start = start_angle % 360
+    sweep = (end_angle - start_angle) % 360
+    if sweep == 0 and end_angle != start_angle:
+        sweep = 360
+    if start + sweep <= 360:
+        intervals = [(start, start + sweep)]
+    else:
+        intervals = [(start, 360), (0, start + sweep - 360)]
+
+    quadrants = []
+    for q in range(4):
+        lo, hi = 90 * q, 90 * (q + 1)
+        ranges = []
+        for a, b in intervals:
+            a, b = max(a, lo), min(b, hi)
+            if a > b:
+                continue
+            if a == lo and b == hi:
+                ranges = None
+                break
+            ranges.append(((np.cos(np.radians(a)), np.sin(np.radians(a))),
+                           (np.cos(np.radians(b)), np.sin(np.radians(b)))))
+        quadrants.append(ranges)
+    return quadrants
+
+
+def midpoint_arc(xc, yc, rx, ry, start_angle, end_angle):
+    """Midpoint ellipse arc from start_angle to end_angle (degrees, CCW).
+
+    Angles are the polar angle of each pixel about the centre. Quadrants
+    outside the arc are skipped entirely, and pixels in partially covered
+    quadrants are tested against the bounding directions with two cross
+    products instead of an atan2 per pixel. Pass rx == ry for circular arcs.
+    """
+    points = []
+    quadrants = [(sx, sy, ranges) for (sx, sy), ranges
+                 in zip([(1, 1), (-1, 1), (-1, -1), (1, -1)],
+                        _arc_quadrant_ranges(start_angle, end_angle))
+                 if ranges != []]
+    if not quadrants:
+        return points
+
+    if ry == 0:
+        offsets = [(x, 0) for x in range(rx + 1)]
+    elif rx == 0:
+        offsets = [(0, y) for y in range(ry + 1)]
+    else:
+        offsets = _ellipse_quadrant(rx, ry)
+
+    for x, y in offsets:
+        for sx, sy, ranges in quadrants:
+            px, py = sx * x, sy * y
+            if ranges is not None:
+                tolerance = -1e-9 * (x + y)
+                if not any(ua[0] * py - ua[1] * px >= tolerance and
+                           px * ub[1] - py * ub[0] >= tolerance
+                           for ua, ub in ranges):
+                    continue
+            points.append((xc + px, yc + py))
+
+    if rx == 0 or ry == 0:
+        # Mirroring a zero offset lands on the same pixel in two quadrants;
+        # keep one of each so the segment matches midpoint_ellipse
+        points = list(dict.fromkeys(points))
     return points
 
 
+def _snap(values):
+    """Round values within float noise of an integer onto it"""
+    nearest = np.rint(values)
+    return np.where(np.abs(values - nearest) < 1e-9, nearest, values)
+
+
+def thick_line_spans(x1, y1, x2, y2, width, cap='butt'):
+    """Horizontal pixel runs covering a stroke of the given width.
+
+    The stroke is the rectangle of half-width width / 2 around the segment,
+    extended by half the width for cap='square', or the capsule with
+    rounded ends for cap='round'. Each scanline's extent is solved for all
+    rows at once from the shape's edges. A pixel is covered when its
+    centre is inside, using the top-left convention (left/top edges in,
+    right/bottom edges out) so abutting strokes do not share pixels.
+    Returns an (M, 3) int64 array of (y, x_start, x_end) with x_end
+    inclusive.
+    """
+    if cap not in ('butt', 'square', 'round'):
+        raise ValueError(f"Unknown cap style: {cap}")
+
+    half = width / 2
+    dx, dy = x2 - x1, y2 - y1
+    length = np.hypot(dx, dy)
+    ux, uy = (dx / length, dy / length) if length else (1.0, 0.0)
+    nx, ny = -uy, ux
+    extend = half if cap == 'square' or (cap == 'butt' and not length) else 0
+    along = ux * x1 + uy * y1
+    across = nx * x1 + ny * y1
+
+    reach = half + extend
+    ys = np.arange(np.floor(min(y1, y2) - reach),
+                   np.ceil(max(y1, y2) + reach) + 1)
+    left = np.full(len(ys), -np.inf)
+    right = np.full(len(ys), np.inf)
+
+    # Half-planes a*x + b*y <= c bounding the rectangle (the band for round)
+    edges = [(nx, ny, half + across), (-nx, -ny, half - across)]
+    if cap != 'round':
+        edges += [(ux, uy, along + length + extend), (-ux, -uy, extend - along)]
+    for a, b, c in edges:
+        rhs = c - b * ys
+        if abs(a) > 1e-12:
+            bound = _snap(rhs / a)
+            if a > 0:
+                right = np.minimum(right, bound)
+            else:
+                left = np.maximum(left, bound)
+        else:
+            # Horizontal edge: rows on the bottom edge (b > 0) are excluded
+            outside = _snap(rhs) <= 0 if b > 0 else _snap(rhs) < 0
+            left[outside] = np.inf
+
+    if cap == 'round':
+        # Band clipped to the segment, united with the two end discs. The
+        # union is convex, so each row's extent is the hull of the pieces.
+        band_left, band_right = left, right
+        for a, b, c in [(ux, uy, along + length), (-ux, -uy, -along)]:
+            if abs(a) > 1e-12:
+                bound = _snap((c - b * ys) / a)
+                if a > 0:
+                    band_right = np.minimum(band_right, bound)
+                else:
+                    band_left = np.maximum(band_left, bound)
+            else:
+                band_left = np.where(_snap(c - b * ys) < 0, np.inf, band_left)
+        band_empty = band_left >= band_right
+        left = np.where(band_empty, np.inf, band_left)
+        right = np.where(band_empty, -np.inf, band_right)
+        for cx, cy in ((x1, y1), (x2, y2)):
+            h2 = half * half - (ys - cy) ** 2
+            inside = _snap(h2) > 0
+            h = np.sqrt(np.where(inside, h2, 0))
+            left = np.where(inside, np.minimum(left, _snap(cx - h)), left)
+            right = np.where(inside, np.maximum(right, _snap(cx + h)), right)
+
+    x_start = np.ceil(left)
+    x_end = np.ceil(right) - 1
+    rows = np.isfinite(x_start) & np.isfinite(x_end) & (x_start <= x_end)
+    return np.column_stack((ys[rows], x_start[rows], x_end[rows])).astype(np.int64)
+
+
+def thick_line(x1, y1, x2, y2, width, cap='butt'):
+    """Pixels of a thick stroke, each once, as an (N, 2) int64 array.
+
+    Expands thick_line_spans row by row with numpy, so the cost follows the
+    covered area.
+    """
+    spans = thick_line_spans(x1, y1, x2, y2, width, cap)
+    counts = spans[:, 2] - spans[:, 1] + 1
+    row_offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    xs = np.repeat(spans[:, 1], counts) + np.arange(counts.sum()) - row_offsets
+    return np.column_stack((xs, np.repeat(spans[:, 0], counts)))
+
+
+def fill_spans(framebuffer, spans, value=1, origin=(0, 0)):
+    """Write (y, x_start, x_end) runs into a framebuffer indexed [y, x]"""
+    height, width = framebuffer.shape[:2]
+    for y, x_start, x_end in spans:
+        y -= origin[1]
+        x_start = max(x_start - origin[0], 0)
+        x_end = min(x_end - origin[0], width - 1)
+        if 0 <= y < height and x_start <= x_end:
+            framebuffer[y, x_start:x_end + 1] = value
+    return framebuffer
+
+
+# Anti-aliased samples: integer pixel position plus fractional coverage
+COVERAGE_DTYPE = np.dtype([('x', np.int32), ('y', np.int32),
+                           ('coverage', np.float32)])
+COVERAGE_DTYPE_U8 = np.dtype([('x', np.int32), ('y', np.int32),
+                              ('coverage', np.uint8)])
+
+
+def _coverage_samples(xs, ys, coverage, coverage_dtype):
+    """Pack coordinate/coverage arrays, dropping pixels with no coverage"""
+    keep = coverage > 0
+    if coverage_dtype == np.uint8:
+        samples = np.empty(np.count_nonzero(keep), dtype=COVERAGE_DTYPE_U8)
+        samples['coverage'] = np.rint(coverage[keep] * 255)
+    else:
+        samples = np.empty(np.count_nonzero(keep), dtype=COVERAGE_DTYPE)
+        samples['coverage'] = coverage[keep]
+    samples['x'] = xs[keep]
+    samples['y'] = ys[keep]
+    return samples
+
+
+def wu_line(x1, y1, x2, y2, coverage_dtype=np.float32):
+    """Xiaolin Wu anti-aliased line, computed in one vectorized pass.
+
+    Every step along the major axis covers the two pixels straddling the
+    ideal line, weighted by distance. Endpoints are integer pixel centres
+    and get full coverage. Returns a COVERAGE_DTYPE array (or
+    COVERAGE_DTYPE_U8 with coverage scaled to 0-255 for np.uint8).
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    steep = abs(dy) > abs(dx)
+    if steep:
+        x1, y1, x2, y2, dx, dy = y1, x1, y2, x2, dy, dx
+    if x2 < x1:
+        x1, y1, x2, y2, dx, dy = x2, y2, x1, y1, -dx, -dy
+
+    gradient = dy / dx if dx != 0 else 1.0
+    major = np.arange(x1, x2 + 1, dtype=np.int64)
+    minor_exact = y1 + gradient * (major - x1)
+    minor = np.floor(minor_exact)
+    frac = minor_exact - minor
+    minor = minor.astype(np.int64)
+
+    # Interleave the near and far pixel of each step
+    majors = np.repeat(major, 2)
+    minors = np.column_stack((minor, minor + 1)).ravel()
+    coverage = np.column_stack((1 - frac, frac)).ravel()
+
+    if steep:
+        return _coverage_samples(minors, majors, coverage, coverage_dtype)
+    return _coverage_samples(majors, minors, coverage, coverage_dtype)
+
+
+def wu_circle(xc, yc, r, coverage_dtype=np.float32):
+    """Xiaolin Wu anti-aliased circle, computed in one vectorized pass.
+
+    The first octant is evaluated exactly and mirrored 8 ways; pixels shared
+    between octants keep their highest coverage so each appears once.
+    """
+    if r == 0:
+        return _coverage_samples(np.array([xc]), np.array([yc]),
+                                 np.ones(1), coverage_dtype)
+
+    x = np.arange(0, int(np.floor(r / np.sqrt(2))) + 1, dtype=np.int64)
+    y_exact = np.sqrt(float(r) * r - x * x)
+    y = np.floor(y_exact)
+    frac = y_exact - y
+    y = y.astype(np.int64)
+
+    ox = np.concatenate((x, x))
+    oy = np.concatenate((y, y + 1))
+    cov = np.concatenate((1 - frac, frac))
+
+    # 8-way symmetry
+    mx = np.concatenate((ox, -ox, ox, -ox, oy, -oy, oy, -oy))
+    my = np.concatenate((oy, oy, -oy, -oy, ox, ox, -ox, -ox))
+    mcov = np.tile(cov, 8)
+
+    # Deduplicate on a single integer key, which sorts like (x, y) pairs
+    span = 2 * r + 3
+    keys, inverse = np.unique((mx + r + 1) * span + (my + r + 1),
+                              return_inverse=True)
+    coverage = np.zeros(len(keys))
+    np.maximum.at(coverage, inverse, mcov)
+    return _coverage_samples(keys // span - r - 1 + xc,
+                             keys % span - r - 1 + yc, coverage,
+                             coverage_dtype)
+
+
+def composite_coverage(framebuffer, samples, color=1.0, origin=(0, 0)):
+    """Blend anti-aliased samples into a 2D (or HxWxC) framebuffer in place.
+
+    framebuffer is indexed [y, x] with pixel (origin) at index [0, 0];
+    samples falling outside it are clipped. Uses "over" compositing:
+    dst = dst * (1 - a) + color * a.
+    """
+    xs = samples['x'].astype(np.int64) - origin[0]
+    ys = samples['y'].astype(np.int64) - origin[1]
+    alpha = samples['coverage'].astype(np.float64)
+    if samples.dtype['coverage'] == np.uint8:
+        alpha /= 255
+
+    height, width = framebuffer.shape[:2]
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    xs, ys, alpha = xs[inside], ys[inside], alpha[inside]
+    if framebuffer.ndim == 3:
+        alpha = alpha[:, None]
+
+    framebuffer[ys, xs] = framebuffer[ys, xs] * (1 - alpha) + \
+        np.asarray(color) * alpha
+    return framebuffer
+
+
+def line_coverage_error(x1, y1, x2, y2, xs, ys, coverage, samples=8):
+    """Compare rendered intensities with the box-filtered ideal line.
+
+    The ideal line is a 1-pixel-wide stroke between the endpoint pixel
+    centres, extended half a pixel past each end. Its coverage of every
+    pixel is estimated with samples x samples supersampling. Aliased
+    algorithms pass a coverage of 1 for their pixels. Returns the mean and
+    maximum absolute intensity difference over the pixels lit in either.
+    """
+    rendered_coords = np.column_stack((xs, ys)).astype(np.int64)
+    # Every pixel the ideal stroke can touch lies within 1.21 px of it
+    candidates = np.concatenate((thick_line(x1, y1, x2, y2, 3, 'square'),
+                                 rendered_coords))
+    x_min, y_min = candidates.min(axis=0)
+    span = candidates[:, 1].max() - y_min + 1
+    keys, inverse = np.unique((candidates[:, 0] - x_min) * span +
+                              (candidates[:, 1] - y_min), return_inverse=True)
+    px = (keys // span + x_min).astype(np.float64)
+    py = (keys % span + y_min).astype(np.float64)
+
+    rendered = np.zeros(len(keys))
+    np.maximum.at(rendered, inverse[len(candidates) - len(rendered_coords):],
+                  np.asarray(coverage, dtype=np.float64))
+
+    length = np.hypot(x2 - x1, y2 - y1)
+    ux, uy = ((x2 - x1) / length, (y2 - y1) / length) if length else (1.0, 0.0)
+    offsets = (np.arange(samples) + 0.5) / samples - 0.5
+    sx = (px[:, None, None] + offsets[None, None, :]) - x1
+    sy = (py[:, None, None] + offsets[None, :, None]) - y1
+    along = sx * ux + sy * uy
+    across = sy * ux - sx * uy
+    inside = (np.abs(across) <= 0.5) & (along >= -0.5) & (along <= length + 0.5)
+    ideal = inside.mean(axis=(1, 2))
+
+    lit = (ideal > 0) | (rendered > 0)
+    difference = np.abs(rendered - ideal)[lit]
+    return difference.mean(), difference.max()
+
+
 def analyze_line_algorithms(x1, y1, x2, y2):
     """Analyze performance and accuracy of line drawing algorithms."""
     # Calculate slope
@@ -198,17 +754,1215 @@ def analyze_line_algorithms(x1, y1, x2, y2):
                 error = abs(px - x1)
             errors.append(error)
 
+        coords = points_array(points)
+        coverage_error, max_coverage_error = line_coverage_error(
+            x1, y1, x2, y2, coords[:, 0], coords[:, 1], np.ones(len(coords)))
+
         results[name] = {
             'execution_time': execution_time,
             'num_points': len(points),
             'avg_error': np.mean(errors),
             'max_error': max(errors),
+            'coverage_error': coverage_error,
+            'max_coverage_error': max_coverage_error,
             'points': points
         }
 
+    # Anti-aliased Wu line. Positional error is the same distance as above,
+    # weighted by each sample's intensity; the coverage error shows what
+    # the anti-aliasing buys against the box-filtered ideal line.
+    start_time = time.perf_counter()
+    samples = wu_line(x1, y1, x2, y2)
+    execution_time = (time.perf_counter() - start_time) * 1000
+
+    xs = samples['x'].astype(np.float64)
+    ys = samples['y'].astype(np.float64)
+    coverage = samples['coverage'].astype(np.float64)
+    if slope != float('inf'):
+        errors = np.abs(ys - (y1 + slope * (xs - x1)))
+    else:
+        errors = np.abs(xs - x1)
+    coverage_error, max_coverage_error = line_coverage_error(
+        x1, y1, x2, y2, samples['x'], samples['y'], coverage)
+
+    results['Wu'] = {
+        'execution_time': execution_time,
+        'num_points': len(samples),
+        'avg_error': np.sum(coverage * errors) / np.sum(coverage),
+        'max_error': np.max(errors),
+        'coverage_error': coverage_error,
+        'max_coverage_error': max_coverage_error,
+        'points': list(zip(samples['x'].tolist(), samples['y'].tolist())),
+        'coverage': coverage
+    }
+
     return slope, results
 
 
+def points_array(points):
+    """(N, 2) int64 array from an (x, y) tuple list; arrays pass through.
+
+    Flattening through fromiter is several times faster than np.asarray on
+    a list of tuples.
+    """
+    if isinstance(points, np.ndarray):
+        return points.astype(np.int64, copy=False).reshape(-1, 2)
+    return np.fromiter(itertools.chain.from_iterable(points), dtype=np.int64,
+                       count=2 * len(points)).reshape(-1, 2)
+
+
+def circle_radial_errors(points, xc, yc, r):
+    """Absolute radial error of every pixel, in one vectorized pass.
+
+    Uses the exact integer residual x*x + y*y - r*r and divides it by
+    (distance + r), which avoids cancellation between sqrt(...) and r. Falls
+    back to float64 when the squares could overflow int64.
+    """
+    coords = points_array(points)
+    dx = coords[:, 0] - xc
+    dy = coords[:, 1] - yc
+    if r < 2**31 and np.abs(coords - (xc, yc)).max(initial=0) < 2**31:
+        residual = dx * dx + dy * dy - r * r
+    else:
+        dx, dy = dx.astype(np.float64), dy.astype(np.float64)
+        residual = dx * dx + dy * dy - float(r) * r
+    distance = np.hypot(dx, dy)
+    errors = np.abs(residual) / np.maximum(distance + r, 1)
+    return errors
+
+
+def analyze_circle_algorithms(xc, yc, r, bins=20):
+    """Analyze performance and accuracy of circle drawing algorithms."""
+    results = {}
+    algorithms = {
+        'Bresenham': bresenham_circle,
+        'Midpoint': midpoint_circle
+    }
+
+    for name, algo in algorithms.items():
+        # Measure execution time
+        start_time = time.perf_counter()
+        points, octants = algo(xc, yc, r, return_octants=True)
+        execution_time = (time.perf_counter() - start_time) * 1000  # ms
+
+        # Calculate accuracy metrics
+        errors = circle_radial_errors(points, xc, yc, r)
+        histogram, bin_edges = np.histogram(errors, bins=bins, range=(0, 1))
+
+        results[name] = {
+            'execution_time': execution_time,
+            'num_points': len(points),
+            'avg_error': errors.mean(),
+            'max_error': errors.max(),
+            'rms_error': np.sqrt(np.mean(errors * errors)),
+            'histogram': histogram,
+            'bin_edges': bin_edges,
+            'points': points,
+            'octants': octants
+        }
+
+    # Anti-aliased Wu circle: the same radial error, weighted by intensity
+    start_time = time.perf_counter()
+    samples = wu_circle(xc, yc, r)
+    execution_time = (time.perf_counter() - start_time) * 1000
+
+    coverage = samples['coverage'].astype(np.float64)
+    errors = circle_radial_errors(
+        np.column_stack((samples['x'], samples['y'])), xc, yc, r)
+    histogram, bin_edges = np.histogram(errors, bins=bins, range=(0, 1),
+                                        weights=coverage)
+
+    results['Wu'] = {
+        'execution_time': execution_time,
+        'num_points': len(samples),
+        'avg_error': np.sum(coverage * errors) / np.sum(coverage),
+        'max_error': errors.max(),
+        'rms_error': np.sqrt(np.sum(coverage * errors * errors) /
+                             np.sum(coverage)),
+        'histogram': histogram,
+        'bin_edges': bin_edges,
+        'points': list(zip(samples['x'].tolist(), samples['y'].tolist())),
+        'coverage': coverage
+    }
+
+    return results
+
+
+# Geometric sweep of line lengths / circle radii: 10, 31, 100, ... 10**7
+SCALING_SIZES = [int(10 ** (k / 2)) for k in range(2, 15)]
+
+
+def scaling_engines():
+    """Line and circle engines compared by scaling_analysis"""
+    lines = {'DDA': dda_line, 'Bresenham': bresenham_line,
+             'Midpoint': midpoint_line, 'Wu': wu_line}
+    circles = {'Bresenham': bresenham_circle, 'Midpoint': midpoint_circle,
+               'Wu': wu_circle}
+    for reference_name, alternates in ALTERNATE_ENGINES.items():
+        target = circles if 'circle' in reference_name else lines
+        target.update(alternates)
+    return {'lines': lines, 'circles': circles}
+
+
+def scaling_analysis(sizes=SCALING_SIZES, time_budget=5.0,
+                     memory_budget=2**30, progress=None, stop=None,
+                     tracing=None):
+    """Time and peak memory of every engine over growing sizes.
+
+    Lines run from (0, 0) to (n, 3n/7), circles use radius n. Each size is
+    run once for time and once under tracemalloc for the peak, which is
+    measured from a baseline taken right before the call. Tracing is
+    process-wide, so the tracing event (if given) is set during the traced
+    run for other threads to hold off allocating. An engine stops before
+    the next size if its cost scaled by the size ratio would exceed
+    time_budget seconds or memory_budget bytes. progress(kind, name, row)
+    is called after each measurement and a set stop event ends the sweep
+    early. Returns {kind: {name: [(size, ms, peak bytes, pixels)]}}.
+    """
+    results = {}
+    for kind, engines in scaling_engines().items():
+        results[kind] = {}
+        for name, algo in engines.items():
+            rows = results[kind][name] = []
+            # Untimed warm-up so JIT compilation is not charged to a size
+            algo(*((0, 0, 1, 1) if kind == 'lines' else (0, 0, 1)))
+            for i, n in enumerate(sizes):
+                if stop is not None and stop.is_set():
+                    return results
+                args = (0, 0, n, 3 * n // 7) if kind == 'lines' else (0, 0, n)
+
+                start_time = time.perf_counter()
+                pixels = len(algo(*args))
+                elapsed = time.perf_counter() - start_time
+
+                if tracing is not None:
+                    tracing.set()
+                tracemalloc.start()
+                try:
+                    baseline, _ = tracemalloc.get_traced_memory()
+                    tracemalloc.reset_peak()
+                    algo(*args)
+                    _, peak = tracemalloc.get_traced_memory()
+                    peak -= baseline
+                finally:
+                    tracemalloc.stop()
+                    if tracing is not None:
+                        tracing.clear()
+
+                row = (n, elapsed * 1000, peak, pixels)
+                rows.append(row)
+                if progress is not None:
+                    progress(kind, name, row)
+
+                if i + 1 < len(sizes):
+                    ratio = sizes[i + 1] / n
+                    if elapsed * ratio > time_budget or \
+                            peak * ratio > memory_budget:
+                        break
+    return results
+
+
+def find_crossovers(series):
+    """Sizes at which the fastest engine changes.
+
+    series maps engine name to scaling_analysis rows. Returns a list of
+    (size, previously fastest, now fastest). An engine that dropped out of
+    the sweep is not counted as overtaken.
+    """
+    times = {}
+    for name, rows in series.items():
+        for n, ms, _, _ in rows:
+            times.setdefault(n, {})[name] = ms
+
+    crossovers = []
+    fastest = None
+    for n in sorted(times):
+        leader = min(times[n], key=times[n].get)
+        if fastest in times[n] and leader != fastest:
+            crossovers.append((n, fastest, leader))
+        fastest = leader
+    return crossovers
+
+
+# Compiled backend. The kernels mirror the reference loops step for step
+# but write into preallocated int64 arrays, which lets Numba compile them.
+# When run as the script, njit(cache=True) keeps the machine code in
+# __pycache__ so only the very first run pays for compilation. Numba's cache
+# entries record the module name, so it stays off when the file is loaded
+# under any other name.
+def _dda_line_kernel(x1, y1, x2, y2):
+    dx = x2 - x1
+    dy = y2 - y1
+    steps = abs(dx) if abs(dx) > abs(dy) else abs(dy)
+    out = np.empty((steps + 1, 2), dtype=np.int64)
+    if steps == 0:
+        out[0, 0] = x1
+        out[0, 1] = y1
+        return out
+
+    x_increment = dx / steps
+    y_increment = dy / steps
+    # The reference rounds the exact integer start point, which a float
+    # cannot hold beyond 2**53; every later step is float arithmetic there too
+    out[0, 0] = x1
+    out[0, 1] = y1
+    x = float(x1) + x_increment
+    y = float(y1) + y_increment
+    for i in range(1, steps + 1):
+        # rint rounds half to even, like round() in the reference
+        out[i, 0] = np.int64(np.rint(x))
+        out[i, 1] = np.int64(np.rint(y))
+        x += x_increment
+        y += y_increment
+    return out
+
+
+def _bresenham_line_kernel(x1, y1, x2, y2):
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    x, y = x1, y1
+    step_x = 1 if x2 > x1 else -1
+    step_y = 1 if y2 > y1 else -1
+
+    if dx > dy:
+        out = np.empty((dx + 1, 2), dtype=np.int64)
+        p = 2 * dy - dx
+        for i in range(dx + 1):
+            out[i, 0] = x
+            out[i, 1] = y
+            if p >= 0:
+                y += step_y
+                p -= 2 * dx
+            x += step_x
+            p += 2 * dy
+    else:
+        out = np.empty((dy + 1, 2), dtype=np.int64)
+        p = 2 * dx - dy
+        for i in range(dy + 1):
+            out[i, 0] = x
+            out[i, 1] = y
+            if p >= 0:
+                x += step_x
+                p -= 2 * dy
+            y += step_y
+            p += 2 * dx
+    return out
+
+
+def _midpoint_line_kernel(x1, y1, x2, y2):
+    dx = abs(x2 - x1)
+    dy = abs(y2 - y1)
+    x, y = x1, y1
+    step_x = 1 if x2 > x1 else -1
+    step_y = 1 if y2 > y1 else -1
+
+    if dx > dy:
+        out = np.empty((dx + 1, 2), dtype=np.int64)
+        d = 2 * dy - dx
+        incr_e = 2 * dy
+        incr_ne = 2 * (dy - dx)
+        out[0, 0] = x
+        out[0, 1] = y
+        for i in range(1, dx + 1):
+            if d <= 0:
+                d += incr_e
+            else:
+                d += incr_ne
+                y += step_y
+            x += step_x
+            out[i, 0] = x
+            out[i, 1] = y
+    else:
+        out = np.empty((dy + 1, 2), dtype=np.int64)
+        d = 2 * dx - dy
+        incr_n = 2 * dx
+        incr_ne = 2 * (dx - dy)
+        out[0, 0] = x
+        out[0, 1] = y
+        for i in range(1, dy + 1):
+            if d <= 0:
+                d += incr_n
+            else:
+                d += incr_ne
+                x += step_x
+            y += step_y
+            out[i, 0] = x
+            out[i, 1] = y
+    return out
+
+
+def _circle_kernel(xc, yc, r, midpoint):
+    """Both circle algorithms; also fills the octant labels"""
+    # Negative radii draw nothing, as in the references
+    capacity = 8 * max(int(r * 0.7072) + 2, 0)
+    out = np.empty((capacity, 2), dtype=np.int64)
+    octants = np.empty(capacity, dtype=np.uint8)
+    labels = np.array([[2, 3, 8, 6, 1, 4, 7, 5], [2, 2, 8, 8, 1, 4, 1, 4],
+                       [1, 3, 7, 5, 1, 3, 7, 5], [1, 1, 1, 1, 1, 1, 1, 1]],
+                      dtype=np.uint8)
+    x = 0
+    y = r
+    d = 1 - r if midpoint else 3 - 2 * r
+    n = 0
+    while x <= y:
+        out[n, 0] = xc + x
+        out[n, 1] = yc + y
+        out[n + 1, 0] = xc - x
+        out[n + 1, 1] = yc + y
+        out[n + 2, 0] = xc + x
+        out[n + 2, 1] = yc - y
+        out[n + 3, 0] = xc - x
+        out[n + 3, 1] = yc - y
+        out[n + 4, 0] = xc + y
+        out[n + 4, 1] = yc + x
+        out[n + 5, 0] = xc - y
+        out[n + 5, 1] = yc + x
+        out[n + 6, 0] = xc + y
+        out[n + 6, 1] = yc - x
+        out[n + 7, 0] = xc - y
+        out[n + 7, 1] = yc - x
+        if x == 0:
+            row = 3 if y == 0 else 1
+        else:
+            row = 2 if x == y else 0
+        octants[n:n + 8] = labels[row]
+        n += 8
+
+        if midpoint:
+            if d < 0:
+                d = d + 2 * x + 3
+            else:
+                d = d + 2 * (x - y) + 5
+                y -= 1
+        else:
+            if d < 0:
+                d = d + 4 * x + 6
+            else:
+                d = d + 4 * (x - y) + 10
+                y -= 1
+        x += 1
+    return out[:n], octants[:n]
+
+
+# Python ints are unbounded; the kernels are not
+_KERNEL_LIMIT = 2**61
+
+
+def _as_points(coords):
+    return list(zip(coords[:, 0].tolist(), coords[:, 1].tolist()))
+
+
+def _compiled_line(kernel, reference):
+    def engine(x1, y1, x2, y2):
+        if max(abs(x1), abs(y1), abs(x2), abs(y2)) >= _KERNEL_LIMIT:
+            return reference(x1, y1, x2, y2)
+        return _as_points(kernel(x1, y1, x2, y2))
+    engine.__name__ = reference.__name__
+    engine.__doc__ = reference.__doc__
+    engine.kernel = kernel
+    return engine
+
+
+def _compiled_circle(kernel, reference, midpoint):
+    def engine(xc, yc, r, return_octants=False):
+        if max(abs(xc), abs(yc)) + r >= _KERNEL_LIMIT:
+            return reference(xc, yc, r, return_octants)
+        coords, octants = kernel(xc, yc, r, midpoint)
+        if return_octants:
+            return _as_points(coords), octants
+        return _as_points(coords)
+    engine.__name__ = reference.__name__
+    engine.__doc__ = reference.__doc__
+    engine.kernel = kernel
+    return engine
+
+
+NUMBA_ENGINES = {}
+if numba is not None:
+    _jit = numba.njit(cache=__name__ == '__main__')
+    _circle_kernel_jit = _jit(_circle_kernel)
+    NUMBA_ENGINES = {
+        'dda_line': _compiled_line(_jit(_dda_line_kernel), dda_line),
+        'bresenham_line': _compiled_line(_jit(_bresenham_line_kernel),
+                                         bresenham_line),
+        'midpoint_line': _compiled_line(_jit(_midpoint_line_kernel),
+                                        midpoint_line),
+        'bresenham_circle': _compiled_circle(_circle_kernel_jit,
+                                             bresenham_circle, False),
+        'midpoint_circle': _compiled_circle(_circle_kernel_jit,
+                                            midpoint_circle, True),
+    }
+
+
+def warm_up_backend(name=None):
+    """Compile (or load from the disk cache) every kernel of a backend"""
+    for engine in BACKENDS[name or _backend].values():
+        if getattr(engine, 'kernel', None) is not None:
+            if 'circle' in engine.__name__:
+                engine(0, 0, 1)
+            else:
+                engine(0, 0, 1, 1)
+
+
+# Reference implementations that every alternate engine must match exactly
+REFERENCE_ENGINES = {
+    'dda_line': dda_line,
+    'bresenham_line': bresenham_line,
+    'midpoint_line': midpoint_line,
+    'bresenham_circle': bresenham_circle,
+    'midpoint_circle': midpoint_circle,
+}
+
+# Alternate (batched, vectorized, compiled...) engines, keyed by the
+# reference they replace
+ALTERNATE_ENGINES = {
+    'bresenham_line': {
+        'bresenham_polyline': lambda x1, y1, x2, y2: bresenham_polyline(
+            [(x1, y1), (x2, y2)]),
+    },
+}
+
+for _name, _engine in NUMBA_ENGINES.items():
+    ALTERNATE_ENGINES.setdefault(_name, {})[f"numba_{_name}"] = _engine
+
+# Runtime-selectable implementations of the reference algorithms. The pure
+# Python ones are always present and remain the fallback.
+BACKENDS = {'python': REFERENCE_ENGINES}
+if NUMBA_ENGINES:
+    BACKENDS['numba'] = NUMBA_ENGINES
+_backend = os.environ.get('RASTER_BACKEND',
+                          'numba' if NUMBA_ENGINES else 'python')
+if _backend not in BACKENDS:
+    _backend = 'python'
+
+
+def set_backend(name):
+    """Select the backend used by get_engine ('python' or 'numba')"""
+    global _backend
+    if name not in BACKENDS:
+        raise ValueError(f"Backend {name!r} is not available; "
+                         f"choose from {sorted(BACKENDS)}")
+    _backend = name
+
+
+def get_backend():
+    return _backend
+
+
+def get_engine(name):
+    """The active backend's implementation of a reference algorithm"""
+    return BACKENDS[_backend][name]
+
+
+def rasterize_array(name, *args):
+    """Run a reference algorithm on the active backend as an (N, 2) array.
+
+    Compiled engines hand back their kernel output directly, skipping the
+    tuple list that dominates their cost for long primitives.
+    """
+    engine = get_engine(name)
+    kernel = getattr(engine, 'kernel', None)
+    if kernel is None or max(abs(a) for a in args) >= _KERNEL_LIMIT:
+        return points_array(engine(*args))
+    if 'circle' in name:
+        return kernel(*args, name == 'midpoint_circle')[0]
+    return kernel(*args)
+
+
+GOLDEN_CORPUS_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'golden_corpus.json')
+
+
+def points_digest(points):
+    """SHA-256 of a pixel sequence, order included.
+
+    Accepts (x, y) tuple lists or (N, 2) integer arrays so alternate engines
+    can be checked without converting their output first.
+    """
+    data = np.ascontiguousarray(points_array(points), dtype='<i8')
+    return hashlib.sha256(data.tobytes()).hexdigest()
+
+
+def golden_cases():
+    """Argument tuples for the golden corpus, keyed by reference name"""
+    rng = random.Random(20240601)
+
+    line_cases = [(0, 0, 0, 0), (5, -7, 5, -7)]
+    # Every octant plus the axis and diagonal boundaries between them
+    for dx, dy in [(10, 3), (3, 10), (-3, 10), (-10, 3), (-10, -3), (-3, -10),
+                   (3, -10), (10, -3), (10, 0), (0, 10), (-10, 0), (0, -10),
+                   (10, 10), (-10, 10), (-10, -10), (10, -10), (7, 1), (1, 7)]:
+        line_cases.append((0, 0, dx, dy))
+        line_cases.append((-4, 9, -4 + 13 * dx, 9 + 13 * dy))
+    # Large coordinates and long spans
+    line_cases += [(10**6, -10**6, 10**6 + 2503, -10**6 + 977),
+                   (-2**31, 2**31 - 1, -2**31 + 301, 2**31 - 1 - 4000),
+                   # Beyond 2**53 floats no longer hold every integer
+                   (2**60 + 1, 0, 2**60 + 11, 3),
+                   (-2**55 - 3, 2**54 + 1, -2**55 + 40, 2**54 - 17),
+                   (0, 0, 5000, 4999), (0, 0, 4999, 5000)]
+    line_cases += [tuple(rng.randint(-500, 500) for _ in range(4))
+                   for _ in range(40)]
+
+    circle_cases = [(0, 0, 0), (0, 0, 1), (0, 0, 2), (3, -4, 5),
+                    (10**6, -10**6, 1000), (-2**31, 2**31 - 1, 2500),
+                    (2**60 + 1, -2**54 - 1, 300),
+                    (0, 0, 10000), (0, 0, -1), (7, -3, -40)]
+    circle_cases += [(rng.randint(-500, 500), rng.randint(-500, 500),
+                      rng.randint(0, 300)) for _ in range(30)]
+
+    return {name: (circle_cases if 'circle' in name else line_cases)
+            for name in REFERENCE_ENGINES}
+
+
+def generate_golden_corpus(filename=GOLDEN_CORPUS_FILE):
+    """Record the reference outputs as [args, pixel count, digest] triples"""
+    corpus = {}
+    for name, cases in golden_cases().items():
+        algo = REFERENCE_ENGINES[name]
+        corpus[name] = []
+        for args in cases:
+            points = algo(*args)
+            corpus[name].append([list(args), len(points), points_digest(points)])
+
+    # One case per line keeps the file small and its diffs readable
+    with open(filename, 'w') as f:
+        f.write("{\n")
+        for i, (name, cases) in enumerate(corpus.items()):
+            f.write(f' {json.dumps(name)}: [\n')
+            f.write(",\n".join(f"  {json.dumps(case)}" for case in cases))
+            f.write("\n ]" + ("," if i < len(corpus) - 1 else "") + "\n")
+        f.write("}\n")
+    return corpus
+
+
+def verify_golden_corpus(engines, filename=GOLDEN_CORPUS_FILE):
+    """Check engines ({reference name: callable}) against the stored corpus.
+
+    Returns a list of (reference name, args, reason) for every mismatch.
+    """
+    with open(filename) as f:
+        corpus = json.load(f)
+
+    failures = []
+    for name, algo in engines.items():
+        for args, count, digest in corpus[name]:
+            points = algo(*args)
+            if len(points) != count:
+                failures.append((name, tuple(args),
+                                 f"{len(points)} points, expected {count}"))
+            elif points_digest(points) != digest:
+                failures.append((name, tuple(args), "pixels differ"))
+    return failures
+
+
+def differential_test(engine, reference_name, trials=1000, seed=0,
+                      max_coord=10**4, max_failures=10):
+    """Compare engine with a reference on random arguments.
+
+    Coordinates are drawn from a mix of small, medium and large magnitudes
+    so octant switches, short spans and big offsets are all exercised.
+    Returns the failing argument tuples (at most max_failures of them).
+    """
+    reference = REFERENCE_ENGINES[reference_name]
+    rng = random.Random(seed)
+    failures = []
+
+    def coord(limit):
+        scale = rng.choice((4, 64, limit))
+        return rng.randint(-scale, scale)
+
+    for _ in range(trials):
+        if 'circle' in reference_name:
+            # Negative radii are included; every engine must draw nothing
+            args = (coord(max_coord), coord(max_coord),
+                    coord(max_coord // 10))
+        else:
+            x1, y1 = coord(max_coord), coord(max_coord)
+            args = (x1, y1, x1 + coord(max_coord // 10),
+                    y1 + coord(max_coord // 10))
+        if points_digest(engine(*args)) != points_digest(reference(*args)):
+            failures.append(args)
+            if len(failures) >= max_failures:
+                break
+    return failures
+
+
+def run_verification(trials=1000):
+    """Check the references and all alternate engines; True if all pass"""
+    ok = True
+    failures = verify_golden_corpus(REFERENCE_ENGINES)
+    print(f"reference engines vs golden corpus: {len(failures)} failures")
+    for failure in failures:
+        print("  ", *failure)
+    ok = ok and not failures
+
+    for reference_name, alternates in ALTERNATE_ENGINES.items():
+        for alt_name, engine in alternates.items():
+            failures = verify_golden_corpus({reference_name: engine})
+            failures += [(reference_name, args, "differential mismatch")
+                         for args in differential_test(engine, reference_name,
+                                                       trials=trials)]
+            print(f"{alt_name} vs {reference_name}: {len(failures)} failures")
+            for failure in failures:
+                print("  ", *failure)
+            ok = ok and not failures
+    return ok
+
+
+# Primitives the rasterization service accepts, called as func(*args)
+SERVICE_ALGORITHMS = dict(REFERENCE_ENGINES, **{
+    'midpoint_ellipse': midpoint_ellipse,
+    'midpoint_arc': midpoint_arc,
+    'bresenham_polyline': bresenham_polyline,
+    'bresenham_polygon': bresenham_polygon,
+    'scanline_polygon': scanline_polygon,
+    'thick_line': thick_line,
+})
+
+# Wire format. Requests are a 4-byte big-endian length followed by a JSON
+# object:
+#   {"id": n, "op": "rasterize", "primitives": [[algorithm, [args...]], ...]}
+#   {"id": n, "op": "metrics"}
+# Every response frame is a header (request id, primitive index, kind,
+# payload bytes) and the payload. Pixel frames (kind 4 or 8) carry
+# little-endian int32/int64 x, y pairs. One is sent per primitive, in order;
+# a malformed primitive gets an error frame in its own slot. A request that
+# cannot be processed at all gets a single error frame whose index is
+# REQUEST_ERROR_INDEX, and nothing else.
+_REQUEST_HEADER = struct.Struct('!I')
+_FRAME_HEADER = struct.Struct('!IIBI')
+FRAME_ERROR, FRAME_JSON, FRAME_INT32, FRAME_INT64 = 0, 1, 4, 8
+REQUEST_ERROR_INDEX = 0xFFFFFFFF
+
+
+def _rasterize_chunk(primitives):
+    """Worker entry point: rasterize primitives into (kind, payload) pairs"""
+    frames = []
+    for primitive in primitives:
+        try:
+            if not (isinstance(primitive, list) and len(primitive) == 2 and
+                    isinstance(primitive[0], str) and
+                    isinstance(primitive[1], list)):
+                raise ValueError(f"expected [algorithm, [args...]], "
+                                 f"got {primitive!r}")
+            algorithm, args = primitive
+            if algorithm not in SERVICE_ALGORITHMS:
+                raise ValueError(f"unknown algorithm {algorithm!r}")
+            if algorithm in REFERENCE_ENGINES:
+                coords = rasterize_array(algorithm, *args)
+            else:
+                coords = points_array(SERVICE_ALGORITHMS[algorithm](*args))
+        except Exception as e:
+            frames.append((FRAME_ERROR, str(e).encode()))
+            continue
+        if coords.size == 0 or np.abs(coords).max() < 2**31:
+            frames.append((FRAME_INT32, coords.astype('<i4').tobytes()))
+        else:
+            frames.append((FRAME_INT64, coords.astype('<i8').tobytes()))
+    return frames
+
+
+class RasterService:
+    """Asyncio server running rasterization requests on a worker pool.
+
+    Batches are split into chunks of chunk_size primitives, with at most
+    max_pending chunks per connection in flight. Frames are written in
+    order and each write waits for the transport to drain, so a slow client
+    throttles its own work instead of buffering unbounded output.
+    """
+
+    def __init__(self, executor=None, workers=None, chunk_size=64,
+                 max_pending=4):
+        self.executor = executor or ProcessPoolExecutor(workers)
+        self.chunk_size = chunk_size
+        self.max_pending = max_pending
+        self.server = None
+        self.connections = set()
+        self.started = time.perf_counter()
+        self.latencies = collections.deque(maxlen=1000)
+        self.counters = collections.Counter()
+
+    async def start(self, host='127.0.0.1', port=0, path=None):
+        """Listen on a Unix socket if path is given, else on host:port"""
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle, path)
+        else:
+            self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    @property
+    def address(self):
+        return self.server.sockets[0].getsockname()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            for task in self.connections:
+                task.cancel()
+            await asyncio.gather(*self.connections, return_exceptions=True)
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=True)
+
+    def metrics(self):
+        elapsed = time.perf_counter() - self.started
+        latencies = sorted(self.latencies)
+        metrics = dict(self.counters)
+        metrics['uptime_s'] = elapsed
+        metrics['pixels_per_s'] = self.counters['pixels'] / elapsed
+        metrics['primitives_per_s'] = self.counters['primitives'] / elapsed
+        if latencies:
+            metrics['latency_ms'] = {
+                'p50': latencies[len(latencies) // 2],
+                'p99': latencies[int(len(latencies) * 0.99)],
+                'max': latencies[-1],
+            }
+        return metrics
+
+    async def _send(self, writer, request_id, index, kind, payload):
+        writer.write(_FRAME_HEADER.pack(request_id, index, kind, len(payload)))
+        writer.write(payload)
+        self.counters['bytes_sent'] += _FRAME_HEADER.size + len(payload)
+        await writer.drain()
+
+    async def handle(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        self.connections.add(task)
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(_REQUEST_HEADER.size)
+                    (length,) = _REQUEST_HEADER.unpack(header)
+                    request = json.loads(await reader.readexactly(length))
+                except asyncio.IncompleteReadError:
+                    break
+                except ValueError as e:
+                    await self._reject(writer, 0, f"bad request: {e}")
+                    continue
+
+                start = time.perf_counter()
+                if not isinstance(request, dict):
+                    await self._reject(writer, 0,
+                                       "bad request: expected a JSON object")
+                    continue
+                request_id = request.get('id', 0)
+                if not isinstance(request_id, int) or \
+                        not 0 <= request_id < 2**32:
+                    await self._reject(writer, 0, "bad request: id must be "
+                                                  "an unsigned 32-bit integer")
+                    continue
+                op = request.get('op', 'rasterize')
+                if op not in ('rasterize', 'metrics'):
+                    await self._reject(writer, request_id,
+                                       f"bad request: unknown op {op!r}")
+                    continue
+                if op == 'metrics':
+                    await self._send(writer, request_id, 0, FRAME_JSON,
+                                     json.dumps(self.metrics()).encode())
+                    continue
+
+                primitives = request.get('primitives', [])
+                if not isinstance(primitives, list):
+                    await self._reject(writer, request_id,
+                                       "bad request: primitives must be a list")
+                    continue
+
+                pending = collections.deque()
+                index = 0
+                try:
+                    for offset in range(0, len(primitives), self.chunk_size):
+                        chunk = primitives[offset:offset + self.chunk_size]
+                        pending.append(loop.run_in_executor(
+                            self.executor, _rasterize_chunk, chunk))
+                        if len(pending) >= self.max_pending:
+                            index = await self._flush(
+                                writer, request_id, index,
+                                await pending.popleft())
+                    while pending:
+                        index = await self._flush(writer, request_id, index,
+                                                  await pending.popleft())
+                except (ConnectionError, asyncio.CancelledError):
+                    raise
+                except Exception as e:
+                    # Worker pool failure: tell the client to stop waiting
+                    await self._reject(writer, request_id,
+                                       f"request failed: {e}")
+                    continue
+                finally:
+                    for future in pending:
+                        future.cancel()
+
+                self.counters['requests'] += 1
+                self.latencies.append((time.perf_counter() - start) * 1000)
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.connections.discard(task)
+            writer.close()
+
+    async def _reject(self, writer, request_id, message):
+        self.counters['rejected'] += 1
+        await self._send(writer, request_id, REQUEST_ERROR_INDEX, FRAME_ERROR,
+                         message.encode())
+
+    async def _flush(self, writer, request_id, index, frames):
+        for kind, payload in frames:
+            await self._send(writer, request_id, index, kind, payload)
+            if kind in (FRAME_INT32, FRAME_INT64):
+                self.counters['pixels'] += len(payload) // (2 * kind)
+            else:
+                self.counters['errors'] += 1
+            self.counters['primitives'] += 1
+            index += 1
+        return index
+
+
+class RasterClient:
+    """Minimal asyncio client for RasterService"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 1
+        self.lock = asyncio.Lock()
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=None, path=None):
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+    async def _request(self, request, frames):
+        async with self.lock:
+            request['id'] = self.next_id
+            self.next_id += 1
+            body = json.dumps(request).encode()
+            self.writer.write(_REQUEST_HEADER.pack(len(body)) + body)
+            await self.writer.drain()
+
+            responses = []
+            for _ in range(frames):
+                header = await self.reader.readexactly(_FRAME_HEADER.size)
+                _, index, kind, length = _FRAME_HEADER.unpack(header)
+                payload = await self.reader.readexactly(length)
+                if index == REQUEST_ERROR_INDEX:
+                    raise ValueError(payload.decode())
+                responses.append((kind, payload))
+            return responses
+
+    async def rasterize(self, primitives):
+        """Rasterize [(algorithm, args), ...] into a list of (N, 2) arrays.
+
+        A primitive the server rejected comes back as a ValueError instance
+        in its slot rather than aborting the whole batch.
+        """
+        primitives = [[algorithm, list(args)] for algorithm, args in primitives]
+        responses = await self._request(
+            {'op': 'rasterize', 'primitives': primitives}, len(primitives))
+        results = []
+        for kind, payload in responses:
+            if kind == FRAME_ERROR:
+                results.append(ValueError(payload.decode()))
+            else:
+                dtype = '<i4' if kind == FRAME_INT32 else '<i8'
+                results.append(np.frombuffer(payload, dtype=dtype).reshape(-1, 2))
+        return results
+
+    async def metrics(self):
+        [(_, payload)] = await self._request({'op': 'metrics'}, 1)
+        return json.loads(payload)
+
+
+def serve(host='127.0.0.1', port=8765, path=None, workers=None):
+    """Run the rasterization service until interrupted"""
+    async def main():
+        service = RasterService(workers=workers)
+        server = await service.start(host, port, path)
+        print(f"Serving rasterizers on {path or service.address}")
+        try:
+            await server.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+
+
+def _translate_args(algorithm, args, dx, dy):
+    """Shift a primitive's arguments by (dx, dy)"""
+    args = list(args)
+    if 'polyline' in algorithm or 'polygon' in algorithm:
+        args[0] = [(x + dx, y + dy) for x, y in args[0]]
+    elif 'line' in algorithm:
+        args[0:4] = [args[0] + dx, args[1] + dy, args[2] + dx, args[3] + dy]
+    else:
+        args[0:2] = [args[0] + dx, args[1] + dy]
+    return args
+
+
+class TiledScene:
+    """Scene of rasterized primitives binned into fixed-size tiles.
+
+    Each primitive is rasterized once when it is added or changed, and its
+    pixels are split per tile. A tile index maps every tile to the
+    primitives touching it. Each tile caches a tile_size x tile_size mask,
+    and an edit only marks the tiles the old and new pixels touch as dirty.
+    Those masks are rebuilt lazily from the per-primitive pieces, so the
+    cost of an edit follows the edited area rather than the scene size.
+    Primitives are any SERVICE_ALGORITHMS entry.
+    """
+
+    def __init__(self, tile_size=64):
+        self.tile_size = tile_size
+        self.primitives = {}        # id -> (algorithm, args)
+        self.pieces = {}            # id -> {tile: (N, 2) pixel array}
+        self.tile_index = {}        # tile -> set of primitive ids
+        self.tiles = {}             # tile -> cached uint8 mask
+        self.dirty = set()
+        self.next_id = 1
+
+    def _bin(self, points):
+        """Split pixels into {(tx, ty): (N, 2) array}"""
+        coords = points_array(points)
+        if len(coords) == 0:
+            return {}
+        tile_keys = coords // self.tile_size
+        order = np.lexsort((tile_keys[:, 1], tile_keys[:, 0]))
+        coords, tile_keys = coords[order], tile_keys[order]
+        breaks = np.flatnonzero(np.any(tile_keys[1:] != tile_keys[:-1],
+                                       axis=1)) + 1
+        return {(int(tile_keys[start, 0]), int(tile_keys[start, 1])): piece
+                for start, piece in zip(np.concatenate(([0], breaks)),
+                                        np.split(coords, breaks))}
+
+    def _rasterize(self, algorithm, args):
+        return self._bin(SERVICE_ALGORITHMS[algorithm](*args))
+
+    def _insert(self, pid, algorithm, args, pieces):
+        self.primitives[pid] = (algorithm, args)
+        self.pieces[pid] = pieces
+        for tile in pieces:
+            self.tile_index.setdefault(tile, set()).add(pid)
+        self.dirty.update(pieces)
+
+    def _discard(self, pid):
+        del self.primitives[pid]
+        for tile in self.pieces.pop(pid):
+            owners = self.tile_index[tile]
+            owners.discard(pid)
+            if not owners:
+                del self.tile_index[tile]
+            self.dirty.add(tile)
+
+    def add(self, algorithm, *args):
+        """Add a primitive, e.g. add('bresenham_line', 0, 0, 10, 4); returns its id"""
+        args = list(args)
+        pieces = self._rasterize(algorithm, args)
+        pid = self.next_id
+        self.next_id += 1
+        self._insert(pid, algorithm, args, pieces)
+        return pid
+
+    def update(self, pid, *args):
+        """Replace a primitive's arguments"""
+        algorithm, _ = self.primitives[pid]
+        args = list(args)
+        # Rasterize before touching the scene, so bad arguments leave the
+        # old primitive in place
+        pieces = self._rasterize(algorithm, args)
+        self._discard(pid)
+        self._insert(pid, algorithm, args, pieces)
+
+    def move(self, pid, dx, dy):
+        algorithm, args = self.primitives[pid]
+        self.update(pid, *_translate_args(algorithm, args, dx, dy))
+
+    def remove(self, pid):
+        self._discard(pid)
+
+    def query(self, x0, y0, x1, y1):
+        """Ids of primitives with pixels in tiles overlapping the box"""
+        ts = self.tile_size
+        found = set()
+        for tx in range(x0 // ts, x1 // ts + 1):
+            for ty in range(y0 // ts, y1 // ts + 1):
+                found |= self.tile_index.get((tx, ty), set())
+        return found
+
+    def flush(self):
+        """Re-render every dirty tile; returns how many were rebuilt"""
+        ts = self.tile_size
+        rebuilt = len(self.dirty)
+        for tile in self.dirty:
+            owners = self.tile_index.get(tile)
+            if not owners:
+                self.tiles.pop(tile, None)
+                continue
+            mask = np.zeros((ts, ts), dtype=np.uint8)
+            origin = (tile[0] * ts, tile[1] * ts)
+            for pid in owners:
+                piece = self.pieces[pid][tile]
+                mask[piece[:, 1] - origin[1], piece[:, 0] - origin[0]] = 1
+            self.tiles[tile] = mask
+        self.dirty.clear()
+        return rebuilt
+
+    def render(self, x0, y0, width, height):
+        """uint8 framebuffer [y, x] of the region whose corner is (x0, y0)"""
+        self.flush()
+        ts = self.tile_size
+        framebuffer = np.zeros((height, width), dtype=np.uint8)
+        for tx in range(x0 // ts, (x0 + width - 1) // ts + 1):
+            for ty in range(y0 // ts, (y0 + height - 1) // ts + 1):
+                mask = self.tiles.get((tx, ty))
+                if mask is None:
+                    continue
+                # Overlap of the tile with the requested region
+                left, top = max(tx * ts, x0), max(ty * ts, y0)
+                right = min((tx + 1) * ts, x0 + width)
+                bottom = min((ty + 1) * ts, y0 + height)
+                framebuffer[top - y0:bottom - y0, left - x0:right - x0] = \
+                    mask[top - ty * ts:bottom - ty * ts,
+                         left - tx * ts:right - tx * ts]
+        return framebuffer
+
+    def pixels(self):
+        """All lit pixels as an (N, 2) array, each pixel once"""
+        self.flush()
+        ts = self.tile_size
+        chunks = []
+        for (tx, ty), mask in self.tiles.items():
+            ys, xs = np.nonzero(mask)
+            chunks.append(np.column_stack((xs + tx * ts, ys + ty * ts)))
+        if not chunks:
+            return np.empty((0, 2), dtype=np.int64)
+        return np.concatenate(chunks)
+
+
+_NULL_SPAN = nullcontext()
+
+
+class StageProfiler:
+    """Collect wall-clock timings for the named stages of a drawing pass.
+
+    When disabled, span() hands back a shared no-op context manager so the
+    instrumented code pays only an attribute lookup and a branch.
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.spans = []
+
+    def reset(self):
+        self.spans = []
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((name, start, time.perf_counter() - start))
+
+    def span(self, name):
+        """Context manager timing the enclosed block as stage `name`"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._timed(name)
+
+    def profiled(self, name):
+        """Decorator timing every call of the wrapped function as `name`"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self._timed(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def summary(self):
+        """Aggregate spans per stage, in first-seen order"""
+        stages = {}
+        for name, _, duration in self.spans:
+            stage = stages.setdefault(name, {'calls': 0, 'total_ms': 0.0})
+            stage['calls'] += 1
+            stage['total_ms'] += duration * 1000
+        for stage in stages.values():
+            stage['mean_ms'] = stage['total_ms'] / stage['calls']
+        return stages
+
+    def format_summary(self):
+        stages = self.summary()
+        total = sum(stage['total_ms'] for stage in stages.values())
+        lines = ["Stage breakdown:"]
+        for name, stage in stages.items():
+            share = stage['total_ms'] / total * 100 if total else 0.0
+            lines.append(f"  {name}: {stage['total_ms']:.4f} ms ({share:.1f}%)")
+        lines.append(f"  total: {total:.4f} ms")
+        return "\n".join(lines) + "\n"
+
+    def to_json(self, filename):
+        with open(filename, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
+
+    def to_chrome_trace(self, filename):
+        """Write spans in the Chrome trace event format (chrome://tracing)"""
+        events = [{'name': name, 'ph': 'X', 'pid': 1, 'tid': 1,
+                   'ts': start * 1e6, 'dur': duration * 1e6}
+                  for name, start, duration in self.spans]
+        with open(filename, 'w') as f:
+            json.dump({'traceEvents': events}, f)
+
+
+def write_points_csv(filename, header, all_points):
+    """Write {algorithm: [table rows]} to a CSV file under header"""
+    with open(filename, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for algo_name, points in all_points.items():
+            for point in points:
+                writer.writerow([algo_name.upper()] + list(point))
+
+
+def export_profile(profiler):
+    """Ask for a file name and save the profiler spans as JSON or trace"""
+    if not profiler.spans:
+        messagebox.showwarning("Export Warning",
+                               "No stage timings recorded! Enable profiling "
+                               "and draw first.")
+        return
+
+    filename = filedialog.asksaveasfilename(
+        defaultextension='.json',
+        filetypes=[("Chrome trace", "*.trace.json"),
+                   ("JSON summary", "*.json"), ("All files", "*.*")],
+        title="Export Stage Timings"
+    )
+
+    if filename:
+        try:
+            if filename.endswith('.trace.json'):
+                profiler.to_chrome_trace(filename)
+            else:
+                profiler.to_json(filename)
+            messagebox.showinfo("Export Successful",
+                                f"Stage timings have been exported to:\n{filename}")
+        except Exception as e:
+            messagebox.showerror("Export Error",
+                                 f"An error occurred while exporting:\n{str(e)}")
+
+
 class LineAnalyzer:
     def __init__(self, root):
         self.root = root
@@ -238,9 +1992,22 @@ class LineAnalyzer:
                     x1, y1, x2, y2)
             ).grid(row=i, column=0, pady=5)
 
+        # Scaling / stress analysis over geometrically growing sizes
+        self.scaling_thread = None
+        self.scaling_stop = threading.Event()
+        self.scaling_tracing = threading.Event()
+        self.scaling_queue = queue.Queue()
+        ttk.Button(self.left_panel, text="Scaling Analysis",
+                   command=self.run_scaling_analysis).grid(
+            row=len(self.test_cases), column=0, pady=5)
+        ttk.Button(self.left_panel, text="Stop Scaling",
+                   command=self.scaling_stop.set).grid(
+            row=len(self.test_cases) + 1, column=0, pady=5)
+
         # Results display
         self.results_text = tk.Text(self.left_panel, height=20, width=60)
-        self.results_text.grid(row=0, column=1, rowspan=len(self.test_cases))
+        self.results_text.grid(row=0, column=1,
+                               rowspan=len(self.test_cases) + 2)
 
         # Create main frame with scrollbars for the chart area
         self.main_frame = ttk.Frame(self.root)
@@ -292,6 +2059,10 @@ class LineAnalyzer:
 
     def run_analysis(self, x1, y1, x2, y2):
         self.results_text.delete(1.0, tk.END)
+        if self.ax not in self.fig.axes:
+            # Coming back from the scaling plots
+            self.fig.clear()
+            self.ax = self.fig.add_subplot(111)
         self.ax.clear()
 
         slope, results = analyze_line_algorithms(x1, y1, x2, y2)
@@ -299,13 +2070,15 @@ class LineAnalyzer:
         # Display results
         self.results_text.insert(tk.END, f"Slope: {slope:.2f}\n\n")
 
-        colors = {'DDA': 'red', 'Bresenham': 'blue', 'Midpoint': 'green'}
+        colors = {'DDA': 'red', 'Bresenham': 'blue', 'Midpoint': 'green',
+                  'Wu': 'purple'}
 
         for algo_name, data in results.items():
-            # Plot points
+            # Plot points, shading anti-aliased ones by their coverage
             x_coords, y_coords = zip(*data['points'])
+            alpha = 0.6 * data['coverage'] if 'coverage' in data else 0.6
             self.ax.scatter(x_coords, y_coords, color=colors[algo_name],
-                            label=f"{algo_name}", alpha=0.6, s=20)
+                            label=f"{algo_name}", alpha=alpha, s=20)
 
             # Display metrics
             self.results_text.insert(tk.END, f"{algo_name} Algorithm:\n")
@@ -316,13 +2089,111 @@ class LineAnalyzer:
             self.results_text.insert(
                 tk.END, f"Average error: {data['avg_error']:.4f}\n")
             self.results_text.insert(
-                tk.END, f"Maximum error: {data['max_error']:.4f}\n\n")
+                tk.END, f"Maximum error: {data['max_error']:.4f}\n")
+            self.results_text.insert(
+                tk.END, f"Coverage error: {data['coverage_error']:.4f} "
+                        f"(max {data['max_coverage_error']:.4f})\n\n")
 
         self.ax.grid(True)
         self.ax.legend()
         self.ax.set_aspect('equal')
         self.canvas.draw()
 
+    def run_scaling_analysis(self):
+        """Start the scaling sweep in a background thread"""
+        if self.scaling_thread is not None and self.scaling_thread.is_alive():
+            return
+
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, "Scaling analysis running...\n\n")
+        self.scaling_results = {}
+        self.scaling_stop.clear()
+
+        def worker():
+            results = scaling_analysis(
+                progress=lambda *row: self.scaling_queue.put(row),
+                stop=self.scaling_stop, tracing=self.scaling_tracing)
+            self.scaling_queue.put(results)
+
+        self.scaling_thread = threading.Thread(target=worker, daemon=True)
+        self.scaling_thread.start()
+        self.root.after(200, self.poll_scaling_analysis)
+
+    def poll_scaling_analysis(self):
+        """Pick up measurements from the worker thread on the Tk thread"""
+        if self.scaling_tracing.is_set():
+            # Redrawing now would count towards the traced peak memory
+            self.root.after(50, self.poll_scaling_analysis)
+            return
+
+        finished = None
+        updated = False
+        while True:
+            try:
+                item = self.scaling_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, dict):
+                finished = item
+                continue
+            kind, name, (n, ms, peak, pixels) = item
+            self.scaling_results.setdefault(kind, {}).setdefault(
+                name, []).append((n, ms, peak, pixels))
+            self.results_text.insert(
+                tk.END, f"{kind} {name} n={n}: {ms:.2f} ms, "
+                        f"peak {peak / 2**20:.2f} MiB\n")
+            self.results_text.see(tk.END)
+            updated = True
+
+        if updated or finished is not None:
+            self.plot_scaling(self.scaling_results)
+        if finished is None:
+            self.root.after(200, self.poll_scaling_analysis)
+            return
+
+        self.results_text.insert(tk.END, "\nCrossover points:\n")
+        for kind, series in finished.items():
+            crossovers = find_crossovers(series)
+            for n, before, after in crossovers:
+                self.results_text.insert(
+                    tk.END, f"{kind}: {after} overtakes {before} at n={n}\n")
+            if not crossovers:
+                self.results_text.insert(tk.END, f"{kind}: none\n")
+        self.results_text.see(tk.END)
+
+    def plot_scaling(self, results):
+        """Log-log throughput and peak memory curves per engine"""
+        self.fig.clear()
+        throughput_ax = self.fig.add_subplot(211)
+        memory_ax = self.fig.add_subplot(212)
+
+        for kind, series in results.items():
+            linestyle = '-' if kind == 'lines' else '--'
+            for name, rows in series.items():
+                sizes = [n for n, _, _, _ in rows]
+                throughput = [pixels / max(ms, 1e-6) * 1000
+                              for _, ms, _, pixels in rows]
+                memory = [max(peak, 1) for _, _, peak, _ in rows]
+                label = f"{name} ({kind})"
+                throughput_ax.plot(sizes, throughput, linestyle, marker='o',
+                                   label=label)
+                memory_ax.plot(sizes, memory, linestyle, marker='o',
+                               label=label)
+
+        throughput_ax.set_xscale('log')
+        throughput_ax.set_yscale('log')
+        throughput_ax.set_ylabel("Pixels / second")
+        throughput_ax.set_title("Throughput vs size")
+        memory_ax.set_xscale('log')
+        memory_ax.set_yscale('log')
+        memory_ax.set_xlabel("Line length / circle radius")
+        memory_ax.set_ylabel("Peak memory (bytes)")
+        for ax in (throughput_ax, memory_ax):
+            ax.grid(True, which='both', alpha=0.3)
+            if ax.lines:
+                ax.legend(fontsize='small')
+        self.canvas.draw()
+
 
 class LineDrawerGUI:
     def __init__(self, root):
@@ -381,6 +2252,17 @@ class LineDrawerGUI:
             self.table_controls, text="Export Points", command=self.export_points)
         self.export_btn.pack(side='right', padx=5)
 
+        # Per-stage profiling controls
+        self.profiler = StageProfiler()
+        self.write_points_csv = self.profiler.profiled("export")(
+            write_points_csv)
+        self.profile_stages = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.table_controls, text="Profile stages",
+                        variable=self.profile_stages).pack(side='left', padx=5)
+        ttk.Button(self.table_controls, text="Export Timings",
+                   command=lambda: export_profile(self.profiler)).pack(
+            side='right', padx=5)
+
         # Create separate frames for each algorithm's table
         self.dda_table_frame = ttk.LabelFrame(
             self.control_frame, text="DDA Points")
@@ -518,14 +2400,8 @@ class LineDrawerGUI:
 
         if filename:
             try:
-                with open(filename, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    # Write headers
-                    writer.writerow(['Algorithm', 'Step', 'X', 'Y'])
-                    # Write points for each algorithm
-                    for algo_name, points in all_points.items():
-                        for point in points:
-                            writer.writerow([algo_name.upper()] + list(point))
+                self.write_points_csv(
+                    filename, ['Algorithm', 'Step', 'X', 'Y'], all_points)
                 messagebox.showinfo("Export Successful",
                                     f"Points data has been exported to:\n{filename}")
             except Exception as e:
@@ -540,16 +2416,19 @@ class LineDrawerGUI:
             y2 = int(self.y2.get())
 
             self.results_text.delete(1.0, tk.END)
+            self.profiler.enabled = self.profile_stages.get()
+            self.profiler.reset()
 
             # Clear all tables
-            for table in self.points_tables.values():
-                for item in table.get_children():
-                    table.delete(item)
+            with self.profiler.span("table clear"):
+                for table in self.points_tables.values():
+                    for item in table.get_children():
+                        table.delete(item)
 
             algorithms = {
-                'dda': (dda_line, 'red', 'DDA'),
-                'bresenham': (bresenham_line, 'blue', 'Bresenham'),
-                'midpoint': (midpoint_line, 'green', 'Midpoint')
+                'dda': (get_engine('dda_line'), 'red', 'DDA'),
+                'bresenham': (get_engine('bresenham_line'), 'blue', 'Bresenham'),
+                'midpoint': (get_engine('midpoint_line'), 'green', 'Midpoint')
             }
 
             # Clear all subplots
@@ -563,19 +2442,21 @@ class LineDrawerGUI:
                     self.algorithm.get(): algorithms[self.algorithm.get()]}
 
             for algo_name, (algo_func, color, label) in selected_algorithms.items():
-                start_time = time.perf_counter()
-                points = algo_func(x1, y1, x2, y2)
-                execution_time = (time.perf_counter() - start_time) * 1000
+                with self.profiler.span(f"{label} rasterize"):
+                    start_time = time.perf_counter()
+                    points = algo_func(x1, y1, x2, y2)
+                    execution_time = (time.perf_counter() - start_time) * 1000
 
                 # Plot points and lines on respective subplot
-                x_coords, y_coords = zip(*points)
-                ax = self.plots[algo_name]
-                ax.scatter(x_coords, y_coords, color=color, s=10)
-                ax.plot(x_coords, y_coords, color=color,
-                        linestyle='-', alpha=0.5)
-                ax.set_title(f"{label} Algorithm")
-                ax.grid(True)
-                ax.set_aspect('equal')
+                with self.profiler.span(f"{label} plot"):
+                    x_coords, y_coords = zip(*points)
+                    ax = self.plots[algo_name]
+                    ax.scatter(x_coords, y_coords, color=color, s=10)
+                    ax.plot(x_coords, y_coords, color=color,
+                            linestyle='-', alpha=0.5)
+                    ax.set_title(f"{label} Algorithm")
+                    ax.grid(True)
+                    ax.set_aspect('equal')
 
                 # Display metrics
                 self.results_text.insert(tk.END,
@@ -585,17 +2466,28 @@ class LineDrawerGUI:
                                          )
 
                 # Add points to corresponding table
-                table = self.points_tables[algo_name]
-                for i, (x, y) in enumerate(points):
-                    table.insert('', 'end', values=(f"{i+1}", f"{x}", f"{y}"))
+                with self.profiler.span(f"{label} table fill"):
+                    table = self.points_tables[algo_name]
+                    for i, (x, y) in enumerate(points):
+                        table.insert('', 'end', values=(f"{i+1}", f"{x}", f"{y}"))
+
+            with self.profiler.span("layout"):
+                self.fig.tight_layout()
+            with self.profiler.span("canvas draw"):
+                self.canvas.draw()
 
-            self.fig.tight_layout()
-            self.canvas.draw()
+            if self.profiler.enabled:
+                self.results_text.insert(tk.END, self.profiler.format_summary())
 
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numeric values")
 
 
+# Reference circle samples, scaled and offset per draw
+_UNIT_CIRCLE_X = np.cos(np.linspace(0, 2*np.pi, 1000))
+_UNIT_CIRCLE_Y = np.sin(np.linspace(0, 2*np.pi, 1000))
+
+
 class CircleDrawerGUI:
     def __init__(self, root):
         self.root = root
@@ -650,6 +2542,17 @@ class CircleDrawerGUI:
             self.table_controls, text="Export Points", command=self.export_points)
         self.export_btn.pack(side='right', padx=5)
 
+        # Per-stage profiling controls
+        self.profiler = StageProfiler()
+        self.write_points_csv = self.profiler.profiled("export")(
+            write_points_csv)
+        self.profile_stages = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.table_controls, text="Profile stages",
+                        variable=self.profile_stages).pack(side='left', padx=5)
+        ttk.Button(self.table_controls, text="Export Timings",
+                   command=lambda: export_profile(self.profiler)).pack(
+            side='right', padx=5)
+
         # Create separate frames for each algorithm's table
         self.bresenham_table_frame = ttk.LabelFrame(
             self.control_frame, text="Bresenham Points")
@@ -793,31 +2696,15 @@ class CircleDrawerGUI:
 
         if filename:
             try:
-                with open(filename, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['Algorithm', 'Step', 'X', 'Y', 'Octant'])
-                    for algo_name, points in all_points.items():
-                        for point in points:
-                            writer.writerow([algo_name.upper()] + list(point))
+                self.write_points_csv(
+                    filename, ['Algorithm', 'Step', 'X', 'Y', 'Octant'],
+                    all_points)
                 messagebox.showinfo("Export Successful",
                                     f"Points data has been exported to:\n{filename}")
             except Exception as e:
                 messagebox.showerror("Export Error",
                                      f"An error occurred while exporting:\n{str(e)}")
 
-    def get_octant(self, x, y, xc, yc):
-        """Determine which octant a point belongs to"""
-        dx = x - xc
-        dy = y - yc
-        if dx >= 0 and dy >= 0:
-            return 1 if dx >= dy else 2
-        elif dx < 0 and dy >= 0:
-            return 3 if -dx <= dy else 4
-        elif dx < 0 and dy < 0:
-            return 5 if -dx >= -dy else 6
-        else:  # dx >= 0 and dy < 0
-            return 7 if dx >= -dy else 8
-
     def draw_circle(self):
         try:
             xc = int(self.xc.get())
@@ -825,15 +2712,18 @@ class CircleDrawerGUI:
             r = int(self.radius.get())
 
             self.results_text.delete(1.0, tk.END)
+            self.profiler.enabled = self.profile_stages.get()
+            self.profiler.reset()
 
             # Clear all tables
-            for table in self.points_tables.values():
-                for item in table.get_children():
-                    table.delete(item)
+            with self.profiler.span("table clear"):
+                for table in self.points_tables.values():
+                    for item in table.get_children():
+                        table.delete(item)
 
             algorithms = {
-                'bresenham': (bresenham_circle, 'blue', 'Bresenham'),
-                'midpoint': (midpoint_circle, 'green', 'Midpoint')
+                'bresenham': (get_engine('bresenham_circle'), 'blue', 'Bresenham'),
+                'midpoint': (get_engine('midpoint_circle'), 'green', 'Midpoint')
             }
 
             # Clear all subplots
@@ -841,9 +2731,8 @@ class CircleDrawerGUI:
                 ax.clear()
 
             # Draw perfect circle for comparison on each subplot
-            theta = np.linspace(0, 2*np.pi, 1000)
-            perfect_x = xc + r * np.cos(theta)
-            perfect_y = yc + r * np.sin(theta)
+            perfect_x = xc + r * _UNIT_CIRCLE_X
+            perfect_y = yc + r * _UNIT_CIRCLE_Y
 
             if self.algorithm.get() == 'all':
                 selected_algorithms = algorithms
@@ -854,26 +2743,29 @@ class CircleDrawerGUI:
             for algo_name, (algo_func, color, label) in selected_algorithms.items():
                 ax = self.plots[algo_name]
                 # Draw perfect circle
-                ax.plot(perfect_x, perfect_y, 'r--',
-                        label='Perfect Circle', alpha=0.5)
+                with self.profiler.span(f"{label} plot"):
+                    ax.plot(perfect_x, perfect_y, 'r--',
+                            label='Perfect Circle', alpha=0.5)
 
-                start_time = time.perf_counter()
-                points = algo_func(xc, yc, r)
-                execution_time = (time.perf_counter() - start_time) * 1000
+                with self.profiler.span(f"{label} rasterize"):
+                    start_time = time.perf_counter()
+                    points, octants = algo_func(xc, yc, r, return_octants=True)
+                    execution_time = (time.perf_counter() - start_time) * 1000
 
                 # Plot points
-                x_coords, y_coords = zip(*points)
-                ax.scatter(x_coords, y_coords, color=color, label=label, s=10)
-                ax.set_title(f"{label} Algorithm")
-                ax.grid(True)
-                ax.set_aspect('equal')
-                ax.legend()
+                with self.profiler.span(f"{label} plot"):
+                    x_coords, y_coords = zip(*points)
+                    ax.scatter(x_coords, y_coords, color=color, label=label, s=10)
+                    ax.set_title(f"{label} Algorithm")
+                    ax.grid(True)
+                    ax.set_aspect('equal')
+                    ax.legend()
 
                 # Calculate and display metrics
-                errors = [abs(np.sqrt((x - xc)**2 + (y - yc)**2) - r)
-                          for x, y in points]
-                avg_error = np.mean(errors)
-                max_error = np.max(errors)
+                with self.profiler.span(f"{label} metrics"):
+                    errors = circle_radial_errors(points, xc, yc, r)
+                    avg_error = errors.mean()
+                    max_error = errors.max()
 
                 self.results_text.insert(tk.END,
                                          f"{label} Algorithm:\n"
@@ -884,20 +2776,44 @@ class CircleDrawerGUI:
                                          )
 
                 # Add points to corresponding table
-                table = self.points_tables[algo_name]
-                for i, (x, y) in enumerate(points):
-                    octant = self.get_octant(x, y, xc, yc)
-                    table.insert('', 'end', values=(
-                        f"{i+1}", f"{x}", f"{y}", f"{octant}"))
+                with self.profiler.span(f"{label} table fill"):
+                    table = self.points_tables[algo_name]
+                    for i, ((x, y), octant) in enumerate(zip(points, octants)):
+                        table.insert('', 'end', values=(
+                            f"{i+1}", f"{x}", f"{y}", f"{octant}"))
+
+            with self.profiler.span("layout"):
+                self.fig.tight_layout()
+            with self.profiler.span("canvas draw"):
+                self.canvas.draw()
 
-            self.fig.tight_layout()
-            self.canvas.draw()
+            if self.profiler.enabled:
+                self.results_text.insert(tk.END, self.profiler.format_summary())
 
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numeric values")
 
 
 if __name__ == "__main__":
+    if '--generate-corpus' in sys.argv:
+        generate_golden_corpus()
+        sys.exit(0)
+    if '--verify' in sys.argv:
+        sys.exit(0 if run_verification() else 1)
+    if '--backend' in sys.argv:
+        set_backend(sys.argv[sys.argv.index('--backend') + 1])
+    if '--serve' in sys.argv:
+        # --serve [PORT | unix socket path]
+        target = sys.argv[sys.argv.index('--serve') + 1:][:1]
+        if target and not target[0].isdigit():
+            serve(path=target[0])
+        else:
+            serve(port=int(target[0]) if target else 8765)
+        sys.exit(0)
+
+    # Load the compiled kernels off the UI thread so startup is not delayed
+    threading.Thread(target=warm_up_backend, daemon=True).start()
+
     root = tk.Tk()
     root.title("Drawing Algorithms Comparison")
 
@@ -0,0 +1,24 @@
+"""Reference engines against the golden corpus, alternates against references."""
+import importlib.util
+import os
+import sys
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'Bresenham-Mid-point-Circle.py')
+spec = importlib.util.spec_from_file_location('drawing_algorithms', SCRIPT)
+drawing = importlib.util.module_from_spec(spec)
+sys.modules['drawing_algorithms'] = drawing
+spec.loader.exec_module(drawing)
+
+
+def test_reference_engines_match_golden_corpus():
+    assert drawing.verify_golden_corpus(drawing.REFERENCE_ENGINES) == []
+
+
+def test_alternate_engines_match_references():
+    for reference_name, alternates in drawing.ALTERNATE_ENGINES.items():
+        for alt_name, engine in alternates.items():
+            assert drawing.verify_golden_corpus({reference_name: engine}) == []
+            failures = drawing.differential_test(engine, reference_name,
+                                                 trials=200)
+            assert failures == [], (alt_name, failures)
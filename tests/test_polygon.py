@@ -0,0 +1,27 @@
+"""Pixel-set properties of the polyline and polygon rasterizers."""
+import importlib.util
+import os
+import sys
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'Bresenham-Mid-point-Circle.py')
+spec = importlib.util.spec_from_file_location('drawing_algorithms', SCRIPT)
+drawing = importlib.util.module_from_spec(spec)
+sys.modules['drawing_algorithms'] = drawing
+spec.loader.exec_module(drawing)
+
+
+def test_polygon_emits_each_pixel_once():
+    for vertices in ([(-4, -12), (10, -5), (13, 17)],
+                     [(0, 0), (20, 1), (0, 2)],
+                     [(0, 0), (9, 0), (9, 9), (0, 9)]):
+        for filled in (False, True):
+            p = drawing.bresenham_polygon(vertices, filled=filled)
+            assert len(p) == len(set(p))
+            assert set(p) >= set(drawing.bresenham_polyline(vertices, closed=True))
+
+
+def test_coincident_closed_chain_covers_its_pixel():
+    assert drawing.bresenham_polyline([(1, 1), (1, 1)], closed=True) == [(1, 1)]
+    assert drawing.bresenham_polygon([(2, 2), (2, 2), (2, 2)]) == [(2, 2)]
+    assert drawing.bresenham_polygon([(2, 2), (2, 2), (2, 2)], filled=True) == [(2, 2)]
@@ -0,0 +1,89 @@
+"""Local client round trips against RasterService."""
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'Bresenham-Mid-point-Circle.py')
+spec = importlib.util.spec_from_file_location('drawing_algorithms', SCRIPT)
+drawing = importlib.util.module_from_spec(spec)
+sys.modules['drawing_algorithms'] = drawing
+spec.loader.exec_module(drawing)
+
+
+def run_with_client(check, **service_kwargs):
+    async def main():
+        service = drawing.RasterService(executor=ThreadPoolExecutor(2),
+                                        **service_kwargs)
+        await service.start()
+        client = await drawing.RasterClient.connect(port=service.address[1])
+        try:
+            await asyncio.wait_for(check(service, client), timeout=10)
+        finally:
+            await client.close()
+            await service.close()
+
+    asyncio.run(main())
+
+
+async def send_raw(client, body):
+    client.writer.write(drawing._REQUEST_HEADER.pack(len(body)) + body)
+    await client.writer.drain()
+    header = await client.reader.readexactly(drawing._FRAME_HEADER.size)
+    _, index, kind, length = drawing._FRAME_HEADER.unpack(header)
+    return index, kind, await client.reader.readexactly(length)
+
+
+def test_rasterize_matches_reference():
+    primitives = [('bresenham_line', (0, 0, 10, 3)),
+                  ('midpoint_circle', (2, -1, 7)),
+                  ('bresenham_line', (-2**31, 0, -2**31 + 3, 1)),
+                  ('bresenham_polyline', ([(0, 0), (5, 5), (9, 0)], True))] * 3
+
+    async def check(service, client):
+        results = await client.rasterize(primitives)
+        for (algorithm, args), result in zip(primitives, results):
+            expected = drawing.points_array(
+                drawing.SERVICE_ALGORITHMS[algorithm](*args))
+            assert np.array_equal(result, expected)
+        metrics = await client.metrics()
+        assert metrics['primitives'] == len(primitives)
+        assert metrics['requests'] == 1
+
+    run_with_client(check, chunk_size=2, max_pending=2)
+
+
+def test_bad_primitives_get_their_own_error_slot():
+    async def check(service, client):
+        primitives = [['bresenham_line', [0, 0, 3, 1]], ['bresenham_line'],
+                      'midpoint_circle', ['nope', []], ['midpoint_circle', 5],
+                      ['midpoint_circle', [0, 0, 2]]]
+        responses = await client._request(
+            {'op': 'rasterize', 'primitives': primitives}, len(primitives))
+        kinds = [kind for kind, _ in responses]
+        assert kinds == [drawing.FRAME_INT32] + [drawing.FRAME_ERROR] * 4 + \
+            [drawing.FRAME_INT32]
+        # The connection is still usable afterwards
+        [result] = await client.rasterize([('bresenham_line', (0, 0, 2, 2))])
+        assert result.tolist() == [[0, 0], [1, 1], [2, 2]]
+
+    run_with_client(check)
+
+
+def test_bad_requests_are_rejected_without_dropping_the_connection():
+    async def check(service, client):
+        for body in [b'[1, 2]', b'{not json', b'{"id": -1}',
+                     json.dumps({'id': 3, 'primitives': 'x'}).encode(),
+                     json.dumps({'id': 5, 'op': 'metric'}).encode()]:
+            index, kind, payload = await send_raw(client, body)
+            assert index == drawing.REQUEST_ERROR_INDEX
+            assert kind == drawing.FRAME_ERROR
+            assert payload.startswith(b'bad request')
+        assert (await client.metrics())['rejected'] == 5
+
+    run_with_client(check)